@@ -3,9 +3,27 @@
 Validates nodes and edges against the schema defined in graph/schema.json.
 """
 
+from __future__ import annotations
+
 import json
+from collections.abc import Sequence
 from pathlib import Path
 
+# Base type -> (accepted types, label used in error messages).
+_SCALAR_TYPES: dict[str, tuple[tuple[type, ...], str]] = {
+    "string": ((str,), "string"),
+    "number": ((int, float), "number"),
+    "boolean": ((bool,), "boolean"),
+    "datetime": ((str,), "datetime string"),
+    "date": ((str,), "date string"),
+    "object": ((dict,), "object"),
+    # References are strings (node IDs) - loose validation
+    "ref": ((str,), "ref string"),
+}
+
+# Shared result for the (common) no-error case, so valid fields allocate nothing.
+_EMPTY: tuple[str, ...] = ()
+
 
 class SchemaValidator:
     """Validates nodes/edges against graph/schema.json."""
@@ -18,6 +36,9 @@ class SchemaValidator:
         """
         self._schema_path = Path(schema_path)
         self._schema: dict = {}
+        self._entity_field_info: dict[str, dict[str, dict]] = {}
+        self._entity_required: dict[str, tuple[str, ...]] = {}
+        self._rel_cache: dict[str, tuple[str, frozenset[str] | None, list[str]] | None] = {}
         self._load_schema()
 
     def _load_schema(self):
@@ -27,6 +48,25 @@ class SchemaValidator:
                 self._schema = json.load(f)
         else:
             self._schema = {"entities": {}, "relationships": {}}
+        self._build_caches()
+
+    def _build_caches(self):
+        """Pre-parse field types and relationship definitions once per schema load."""
+        self._entity_field_info = {}
+        self._entity_required = {}
+        self._rel_cache = {
+            rel_type: self._parse_relationship(rel_def)
+            for rel_type, rel_def in self._schema.get("relationships", {}).items()
+        }
+        for node_type, entity_def in self._schema.get("entities", {}).items():
+            field_info = {
+                field_name: self._parse_field_type(type_str)
+                for field_name, type_str in entity_def.get("fields", {}).items()
+            }
+            self._entity_field_info[node_type] = field_info
+            self._entity_required[node_type] = tuple(
+                name for name, info in field_info.items() if not info["optional"]
+            )
 
     def _parse_field_type(self, type_str: str) -> dict:
         """Parse a schema field type string into structured info.
@@ -59,51 +99,71 @@ class SchemaValidator:
 
         return info
 
-    def _validate_field_value(self, value, field_info: dict) -> list[str]:
-        """Validate a single field value against its type info."""
-        errors = []
+    def _parse_relationship(self, rel_def: str) -> tuple[str, frozenset[str] | None, list[str]] | None:
+        """Parse a relationship definition into (source, targets, target_list).
+
+        Examples:
+            "contact -> message[]"  -> ("contact", frozenset({"message"}), ["message"])
+            "* -> issue|task"       -> ("*", frozenset({"issue", "task"}), ["issue", "task"])
+            "* -> *"                -> ("*", None, ["*"])
+
+        Returns None for malformed definitions, including non-string values,
+        so a bad entry only fails edges that use it.
+        """
+        if not isinstance(rel_def, str):
+            return None
+        parts = rel_def.replace(" ", "").split("->")
+        if len(parts) != 2:
+            return None
+
+        allowed_source = parts[0]
+        # Strip trailing [] from target
+        allowed_target = parts[1].rstrip("[]")
+        if allowed_target == "*":
+            return (allowed_source, None, [allowed_target])
+
+        # Target may include pipe-separated alternatives like "issue|task"
+        allowed_targets = allowed_target.split("|")
+        return (allowed_source, frozenset(allowed_targets), allowed_targets)
+
+    def _validate_field_value(self, value, field_info: dict) -> Sequence[str]:
+        """Validate a single field value against its type info.
+
+        Returns the shared ``_EMPTY`` tuple when the value is valid.
+        """
         base = field_info["base"]
-        is_array = field_info["array"]
 
-        if is_array:
-            if not isinstance(value, list):
-                errors.append(f"Expected array, got {type(value).__name__}")
-                return errors
-            for i, item in enumerate(value):
-                sub_errors = self._validate_scalar(item, base, field_info)
-                for e in sub_errors:
-                    errors.append(f"[{i}]: {e}")
-            return errors
+        if not field_info["array"]:
+            return self._validate_scalar(value, base, field_info)
 
-        return self._validate_scalar(value, base, field_info)
+        if not isinstance(value, list):
+            return [f"Expected array, got {type(value).__name__}"]
 
-    def _validate_scalar(self, value, base: str, field_info: dict) -> list[str]:
+        errors = None
+        for i, item in enumerate(value):
+            sub_errors = self._validate_scalar(item, base, field_info)
+            if sub_errors:
+                if errors is None:
+                    errors = []
+                errors.extend(f"[{i}]: {e}" for e in sub_errors)
+        return errors if errors is not None else _EMPTY
+
+    def _validate_scalar(self, value, base: str, field_info: dict) -> Sequence[str]:
         """Validate a scalar value against a base type."""
-        errors = []
-        if base == "string":
-            if not isinstance(value, str):
-                errors.append(f"Expected string, got {type(value).__name__}")
-        elif base == "number":
-            if not isinstance(value, (int, float)):
-                errors.append(f"Expected number, got {type(value).__name__}")
-        elif base == "boolean":
-            if not isinstance(value, bool):
-                errors.append(f"Expected boolean, got {type(value).__name__}")
-        elif base == "datetime" or base == "date":
-            if not isinstance(value, str):
-                errors.append(f"Expected {base} string, got {type(value).__name__}")
-        elif base == "object":
-            if not isinstance(value, dict):
-                errors.append(f"Expected object, got {type(value).__name__}")
-        elif base == "enum":
+        if base == "enum":
             allowed = field_info.get("values", [])
             if value not in allowed:
-                errors.append(f"Value '{value}' not in allowed enum values: {allowed}")
-        elif base == "ref":
-            # References are strings (node IDs) - loose validation
-            if not isinstance(value, str):
-                errors.append(f"Expected ref string, got {type(value).__name__}")
-        return errors
+                return [f"Value '{value}' not in allowed enum values: {allowed}"]
+            return _EMPTY
+
+        expected = _SCALAR_TYPES.get(base)
+        if expected is None:
+            return _EMPTY
+        types, label = expected
+        # bool subclasses int, so it must be excluded from "number" explicitly.
+        if not isinstance(value, types) or (base == "number" and isinstance(value, bool)):
+            return [f"Expected {label}, got {type(value).__name__}"]
+        return _EMPTY
 
     def validate_node(self, node_type: str, data: dict) -> tuple[bool, list[str]]:
         """Validate node data against schema.
@@ -116,31 +176,26 @@ class SchemaValidator:
             Tuple of (is_valid, list_of_error_strings).
         """
         errors = []
-        entities = self._schema.get("entities", {})
+        fields = self._entity_field_info.get(node_type)
 
-        if node_type not in entities:
+        if fields is None:
             errors.append(f"Unknown node type: '{node_type}'")
             return (False, errors)
 
-        entity_def = entities[node_type]
-        fields = entity_def.get("fields", {})
-
         # Check required fields are present
-        for field_name, type_str in fields.items():
-            field_info = self._parse_field_type(type_str)
-            if not field_info["optional"] and field_name not in data:
+        for field_name in self._entity_required[node_type]:
+            if field_name not in data:
                 errors.append(f"Missing required field: '{field_name}'")
 
         # Validate provided fields
         for field_name, value in data.items():
-            if field_name not in fields:
+            field_info = fields.get(field_name)
+            if field_info is None:
                 # Extra fields are allowed (extensible schema)
                 continue
-            type_str = fields[field_name]
-            field_info = self._parse_field_type(type_str)
             field_errors = self._validate_field_value(value, field_info)
-            for e in field_errors:
-                errors.append(f"Field '{field_name}': {e}")
+            if field_errors is not _EMPTY:
+                errors.extend(f"Field '{field_name}': {e}" for e in field_errors)
 
         return (len(errors) == 0, errors)
 
@@ -156,24 +211,18 @@ class SchemaValidator:
             Tuple of (is_valid, list_of_error_strings).
         """
         errors = []
-        relationships = self._schema.get("relationships", {})
 
-        if rel_type not in relationships:
+        if rel_type not in self._rel_cache:
             errors.append(f"Unknown relationship type: '{rel_type}'")
             return (False, errors)
 
-        rel_def = relationships[rel_type]
-        # Parse relationship definition like "contact -> message[]" or "* -> *"
-        parts = rel_def.replace(" ", "").split("->")
-        if len(parts) != 2:
+        parsed = self._rel_cache[rel_type]
+        if parsed is None:
+            rel_def = self._schema["relationships"][rel_type]
             errors.append(f"Malformed relationship definition: '{rel_def}'")
             return (False, errors)
 
-        allowed_source = parts[0]
-        allowed_target_raw = parts[1]
-
-        # Strip trailing [] from target
-        allowed_target = allowed_target_raw.rstrip("[]")
+        allowed_source, target_set, allowed_targets = parsed
 
         # Check source type
         if allowed_source != "*" and source_type != allowed_source:
@@ -182,14 +231,12 @@ class SchemaValidator:
                 f"got '{source_type}'"
             )
 
-        # Check target type -- may include pipe-separated alternatives like "issue|task"
-        if allowed_target != "*":
-            allowed_targets = allowed_target.split("|")
-            if target_type not in allowed_targets:
-                errors.append(
-                    f"Relationship '{rel_type}' requires target type in {allowed_targets}, "
-                    f"got '{target_type}'"
-                )
+        # Check target type -- None means wildcard
+        if target_set is not None and target_type not in target_set:
+            errors.append(
+                f"Relationship '{rel_type}' requires target type in {allowed_targets}, "
+                f"got '{target_type}'"
+            )
 
         return (len(errors) == 0, errors)
 
@@ -202,18 +249,7 @@ class SchemaValidator:
         Returns:
             List of field names that are required (non-optional).
         """
-        entities = self._schema.get("entities", {})
-        if node_type not in entities:
-            return []
-
-        fields = entities[node_type].get("fields", {})
-        required = []
-        for field_name, type_str in fields.items():
-            field_info = self._parse_field_type(type_str)
-            if not field_info["optional"]:
-                required.append(field_name)
-
-        return required
+        return list(self._entity_required.get(node_type, ()))
 
     def get_node_types(self) -> list[str]:
         """Return all known entity/node types from the schema."""
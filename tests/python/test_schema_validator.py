@@ -4,7 +4,9 @@ Validates node data, edge type constraints, required-field introspection,
 and schema-level queries.
 """
 
+import json
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -90,6 +92,34 @@ class TestNodeValidation:
         is_valid, errors = schema_validator.validate_node("contact", data)
         assert is_valid is True, f"Expected valid but got errors: {errors}"
 
+    def test_validate_node_rejects_bool_for_number(self, schema_validator):
+        """A boolean is not accepted where the schema declares a number."""
+        data = {
+            "email": "test@example.com",
+            "aliases": [],
+            "interaction_count": True,
+            "links": [],
+        }
+        is_valid, errors = schema_validator.validate_node("contact", data)
+        assert is_valid is False
+        assert errors == ["Field 'interaction_count': Expected number, got bool"]
+
+    def test_validate_node_accepts_type_subclasses(self, schema_validator):
+        """Subclasses of str and dict still satisfy string and object fields."""
+
+        class Email(str):
+            pass
+
+        data = {
+            "email": Email("test@example.com"),
+            "communication_style": OrderedDict(tone="direct"),
+            "aliases": [],
+            "interaction_count": 0,
+            "links": [],
+        }
+        is_valid, errors = schema_validator.validate_node("contact", data)
+        assert is_valid is True, f"Expected valid but got errors: {errors}"
+
 
 # ------------------------------------------------------------------
 # Edge validation
@@ -155,6 +185,26 @@ class TestEdgeValidation:
         assert is_valid_task is True
         assert is_valid_message is False
 
+    def test_validate_edge_malformed_definition(self, tmp_path):
+        """Malformed relationship definitions are reported per edge, not at load."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps({
+            "entities": {},
+            "relationships": {"broken": "a b", "not_a_string": 42, "ok": "* -> *"},
+        }))
+        validator = SchemaValidator(schema_path=str(schema_path))
+
+        is_valid, errors = validator.validate_edge("broken", "a", "b")
+        assert is_valid is False
+        assert errors == ["Malformed relationship definition: 'a b'"]
+
+        is_valid, errors = validator.validate_edge("not_a_string", "a", "b")
+        assert is_valid is False
+        assert errors == ["Malformed relationship definition: '42'"]
+
+        is_valid, _ = validator.validate_edge("ok", "a", "b")
+        assert is_valid is True
+
 
 # ------------------------------------------------------------------
 # Schema introspection